@@ -473,7 +473,7 @@ def test_lighteval_stage(mock_config):
         patch("datasets.Dataset.from_list") as mock_from_list,
     ):
 
-        def load_dataset_side_effect(config, subset):
+        def load_dataset_side_effect(config, subset, settings=None):
             if subset == "single_shot_questions":
                 return single_shot_ds
             elif subset == "multi_hop_questions":
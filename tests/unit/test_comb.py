@@ -2,9 +2,17 @@ import random
 from math import comb
 from itertools import combinations
 
+import numpy as np
 import pytest
 
-from yourbench.utils.dataset_engine import _unrank_comb, _floyd_sample_indices, _sample_exact_combinations
+from yourbench.utils import dataset_engine
+from yourbench.utils.dataset_engine import (
+    _unrank_comb,
+    _pascal_table,
+    _unrank_comb_batch,
+    _floyd_sample_indices,
+    _sample_exact_combinations,
+)
 
 
 def test_comb_basic_cases():
@@ -46,6 +54,39 @@ def test_comb_against_colex_order():
                 assert actual == list(expected), f"Mismatch at n={n}, k={k}, rank={rank}"
 
 
+def test_pascal_table_matches_math_comb():
+    table = _pascal_table(12, 5)
+    for n in range(13):
+        for k in range(6):
+            assert table[n, k] == comb(n, k)
+
+
+def test_pascal_table_large_values_do_not_overflow():
+    table = _pascal_table(80, 40)
+    assert table[80, 40] == comb(80, 40)
+
+
+def test_comb_with_table_matches_without():
+    table = _pascal_table(10, 4)
+    for rank in range(comb(10, 4)):
+        assert _unrank_comb(10, 4, rank, table) == _unrank_comb(10, 4, rank)
+
+
+def test_comb_batch_matches_scalar():
+    for n, k in [(1, 1), (6, 3), (9, 0), (9, 9), (15, 4)]:
+        ranks = list(range(comb(n, k)))
+        batch = _unrank_comb_batch(_pascal_table(n, k), n, k, ranks)
+        assert batch.shape == (len(ranks), k)
+        assert batch.tolist() == [_unrank_comb(n, k, r) for r in ranks]
+
+
+def test_comb_batch_large_universe():
+    n, k = 70, 35
+    ranks = [0, 12345678901234567890, comb(n, k) - 1]
+    batch = _unrank_comb_batch(_pascal_table(n, k), n, k, ranks)
+    assert batch.tolist() == [_unrank_comb(n, k, r) for r in ranks]
+
+
 def test_floyd_basic_properties():
     result = _floyd_sample_indices(10, 5)
     assert len(result) == 5
@@ -119,3 +160,30 @@ def test_sample_deterministic_with_seed():
     result1 = _sample_exact_combinations(list(range(20)), k=4, N=5, rng=rng1)
     result2 = _sample_exact_combinations(list(range(20)), k=4, N=5, rng=rng2)
     assert result1 == result2
+
+
+def test_sample_numpy_generator_no_duplicates():
+    samples = _sample_exact_combinations(list(range(8)), k=3, N=40, np_rng=np.random.default_rng(0))
+    assert len({tuple(sorted(s)) for s in samples}) == 40
+
+
+def test_sample_numpy_generator_deterministic():
+    result1 = _sample_exact_combinations(list(range(20)), k=4, N=5, np_rng=np.random.default_rng(7))
+    result2 = _sample_exact_combinations(list(range(20)), k=4, N=5, np_rng=np.random.default_rng(7))
+    assert result1 == result2
+
+
+def test_sample_numpy_generator_falls_back_for_huge_rank_space():
+    objects = list(range(80))
+    samples = _sample_exact_combinations(objects, k=40, N=3, rng=random.Random(0), np_rng=np.random.default_rng(0))
+    assert len({tuple(s) for s in samples}) == 3
+    assert all(len(s) == 40 for s in samples)
+
+
+def test_comb_batch_numpy_fallback_matches(monkeypatch):
+    n, k = 30, 6
+    table = _pascal_table(n, k)
+    ranks = np.random.default_rng(3).choice(comb(n, k), size=500, replace=False)
+    expected = _unrank_comb_batch(table, n, k, ranks)
+    monkeypatch.setattr(dataset_engine, "njit", None)
+    assert _unrank_comb_batch(table, n, k, ranks).tolist() == expected.tolist()
@@ -0,0 +1,78 @@
+import pytest
+
+from datasets import Dataset
+from datasets.fingerprint import get_temporary_cache_files_directory
+from yourbench.utils import dataset_engine
+from yourbench.utils.dataset_engine import create_cross_document_dataset
+
+
+def _make_chunked_dataset(num_docs: int = 6) -> Dataset:
+    rows = []
+    for d in range(num_docs):
+        rows.append({
+            "document_id": f"doc_{d}",
+            "document_summary": f"summary {d}",
+            "document_text": "text",
+            "multihop_chunks": [
+                {"chunk_ids": [f"doc_{d}_{i}"], "chunks_text": [f"text {d} {i}"]} for i in range(d % 3)
+            ],
+        })
+    return Dataset.from_list(rows)
+
+
+@pytest.fixture
+def stage_cfg():
+    return {"max_combinations": 10, "chunks_per_document": 1, "num_docs_per_combination": [2, 3], "random_seed": 1}
+
+
+def test_cross_document_skips_docs_without_chunks(stage_cfg):
+    result = create_cross_document_dataset(_make_chunked_dataset(), stage_cfg)
+    assert len(result) > 0
+    for row in result:
+        # documents 0 and 3 have no multihop chunks
+        assert not {"doc_0", "doc_3"} & set(row["source_documents"])
+
+
+def test_cross_document_source_indices_follow_selection(stage_cfg):
+    dataset = _make_chunked_dataset().select([5, 4, 2, 1])
+    result = create_cross_document_dataset(dataset, stage_cfg)
+    assert len(result) > 0
+    for row in result:
+        source_ids = {dataset[i]["document_id"] for i in row["source_indices"]}
+        assert source_ids == set(row["source_documents"])
+
+
+def test_cross_document_is_deterministic(stage_cfg):
+    first = create_cross_document_dataset(_make_chunked_dataset(), stage_cfg)
+    second = create_cross_document_dataset(_make_chunked_dataset(), stage_cfg)
+    assert first.to_list() == second.to_list()
+
+
+def test_cross_document_missing_column(stage_cfg):
+    dataset = Dataset.from_list([{"document_id": "a"}, {"document_id": "b"}])
+    assert len(create_cross_document_dataset(dataset, stage_cfg)) == 0
+
+
+def test_cross_document_streams_in_batches(stage_cfg, monkeypatch):
+    expected = create_cross_document_dataset(_make_chunked_dataset(), stage_cfg).to_list()
+    monkeypatch.setattr(dataset_engine, "_CROSS_DOCUMENT_BATCH_SIZE", 3)
+    assert create_cross_document_dataset(_make_chunked_dataset(), stage_cfg).to_list() == expected
+
+
+def test_cross_document_ignores_null_chunks(stage_cfg):
+    rows = [
+        {"document_id": f"doc_{d}", "multihop_chunks": [None, {"chunk_ids": [f"c{d}"], "chunks_text": ["t"]}]}
+        for d in range(3)
+    ]
+    result = create_cross_document_dataset(Dataset.from_list(rows), stage_cfg)
+    assert len(result) > 0
+    for row in result:
+        assert len(row["multihop_chunks"][0]["chunk_ids"]) == row["num_source_docs"]
+
+
+def test_cross_document_is_memory_mapped_from_one_arrow_file(stage_cfg):
+    result = create_cross_document_dataset(_make_chunked_dataset(), stage_cfg)
+    [cache_file] = result.cache_files
+    assert cache_file["filename"].endswith(".arrow")
+    assert cache_file["filename"].startswith(get_temporary_cache_files_directory())
+    assert result.features == dataset_engine._CROSS_DOCUMENT_FEATURES
@@ -0,0 +1,183 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+
+import yaml
+import jinja2
+import pytest
+
+from huggingface_hub import HfApi
+from yourbench.utils import dataset_engine
+from yourbench.utils.dataset_engine import (
+    _DEFAULT_TEMPLATE_PATH,
+    _front_matter,
+    _load_template,
+    _remote_readme,
+    _default_template,
+    _compiled_template,
+    upload_dataset_card,
+    _serialize_config_for_card,
+)
+
+
+def test_serialize_config_masks_secrets():
+    config = {
+        "hf_configuration": {"token": "hf_secret", "hf_dataset_name": "bench"},
+        "model_list": [
+            {"model_name": "m", "api_key": "plain-key", "base_url": "http://x", "max_concurrent_requests": 4},
+            {"model_name": "n", "api_key": "$OPENAI_API_KEY", "extra": ["sk-abc", None, 1.5, True]},
+        ],
+    }
+
+    serialized = yaml.safe_load(_serialize_config_for_card(config))
+
+    assert serialized["hf_configuration"] == {"token": "$HF_TOKEN", "hf_dataset_name": "bench"}
+    assert serialized["model_list"][0]["api_key"] == "$API_KEY"
+    assert serialized["model_list"][0]["max_concurrent_requests"] == 4
+    assert serialized["model_list"][1]["api_key"] == "$OPENAI_API_KEY"
+    assert serialized["model_list"][1]["extra"] == ["$OPENAI_API_KEY", None, 1.5, True]
+    # the original config is left untouched
+    assert config["hf_configuration"]["token"] == "hf_secret"
+
+
+def test_serialize_config_handles_dict_subclasses():
+    config = {"pipeline": OrderedDict(ingestion={"run": True, "api_key": "secret"})}
+    serialized = yaml.safe_load(_serialize_config_for_card(config))
+    assert serialized == {"pipeline": {"ingestion": {"run": True, "api_key": "$API_KEY"}}}
+
+
+def test_load_template_reads_file_once(tmp_path):
+    template = tmp_path / "card.md"
+    template.write_text("# {{ pretty_name }}", encoding="utf-8")
+
+    first = _load_template(str(template))
+    template.write_text("changed", encoding="utf-8")
+
+    assert first == _load_template(str(template)) == "# {{ pretty_name }}"
+    assert "{{ config_yaml }}" in _load_template(_DEFAULT_TEMPLATE_PATH)
+    assert _default_template() is _compiled_template(_load_template(_DEFAULT_TEMPLATE_PATH))
+
+
+def test_compiled_template_is_reused_and_matches_plain_jinja():
+    template_str = "{% if footer %}\n{{ footer }}\n{% endif %}\n"
+    assert _compiled_template(template_str) is _compiled_template(template_str)
+    assert _compiled_template(template_str).render(footer="x") == jinja2.Template(template_str).render(footer="x")
+
+
+@pytest.fixture
+def card_config(monkeypatch):
+    monkeypatch.delenv("HF_HUB_OFFLINE", raising=False)
+    # no remote README unless a test provides one
+    monkeypatch.setattr(HfApi, "hf_hub_download", Mock(side_effect=FileNotFoundError))
+    _remote_readme.cache_clear()
+    return {
+        "hf_configuration": {"hf_dataset_name": "my-cool_bench", "hf_organization": "org", "token": "hf_x"},
+        "pipeline": {"chunking": {"run": True}},
+    }
+
+
+@pytest.fixture
+def remote_readme(tmp_path, monkeypatch):
+    """A README.md served by the mocked hf_hub_download, which records the calling threads."""
+    readme = tmp_path / "README.md"
+    readme.write_text("---\ndataset_info:\n  splits: []\n---\n", encoding="utf-8")
+    threads = []
+
+    def fake_download(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return str(readme)
+
+    download = Mock(side_effect=fake_download)
+    download.threads = threads
+    monkeypatch.setattr(HfApi, "hf_hub_download", download)
+    return readme, download
+
+
+def test_upload_card_fetches_dataset_info_off_the_main_thread(card_config, remote_readme):
+    _, download = remote_readme
+    pushed = []
+    with patch.object(HfApi, "upload_file", lambda self, **kwargs: pushed.append(kwargs)):
+        upload_dataset_card(card_config)
+
+    # README.md is downloaded once per upload, in a worker thread
+    assert len(download.threads) == 1 and download.threads[0] is not threading.main_thread()
+    [kwargs] = pushed
+    assert kwargs["repo_id"] == "org/my-cool_bench"
+    assert kwargs["path_in_repo"] == "README.md"
+    assert kwargs["repo_type"] == "dataset"
+    content = kwargs["path_or_fileobj"].read().decode("utf-8")
+    assert content.startswith("---\npretty_name: My Cool Bench\n")
+    assert "dataset_info:" in content
+    assert "- **chunking**" in content
+
+
+@pytest.mark.parametrize("offline, upload_card", [("1", True), ("0", False)])
+def test_upload_card_skipped_before_reading_settings(card_config, monkeypatch, offline, upload_card):
+    monkeypatch.setenv("HF_HUB_OFFLINE", offline)
+    card_config["hf_configuration"]["upload_card"] = upload_card
+    with patch("yourbench.utils.dataset_engine._extract_settings") as mock_settings:
+        upload_dataset_card(card_config)
+    mock_settings.assert_not_called()
+
+
+def test_remote_readme_fetched_once_until_card_is_pushed(card_config, remote_readme):
+    readme, download = remote_readme
+    info, digest = _remote_readme("org/bench", None)
+    assert info == "dataset_info:\n  splits: []"
+    assert digest == hashlib.blake2b(readme.read_bytes()).hexdigest()
+    assert _remote_readme("org/bench", None) == (info, digest)
+    assert download.call_count == 1
+
+    with patch.object(HfApi, "upload_file"):
+        upload_dataset_card(card_config)
+        upload_dataset_card(card_config)
+    # one download per upload, since each upload replaces the README
+    assert download.call_count == 3
+
+
+def test_upload_card_skips_identical_remote_readme(card_config, remote_readme):
+    remote, _ = remote_readme
+    pushed = []
+    with patch.object(HfApi, "upload_file", lambda self, **kwargs: pushed.append(kwargs["path_or_fileobj"].read())):
+        upload_dataset_card(card_config)
+        assert len(pushed) == 1
+
+        remote.write_bytes(pushed[0])
+        upload_dataset_card(card_config)
+    assert len(pushed) == 1
+
+
+def test_upload_card_failures_do_not_raise(card_config):
+    with patch.object(HfApi, "upload_file", side_effect=ConnectionError("boom")) as upload:
+        upload_dataset_card(card_config)
+    upload.assert_called_once()
+
+    del card_config["hf_configuration"]["hf_dataset_name"]
+    upload_dataset_card(card_config)
+
+
+def test_front_matter_without_dataset_info_has_no_blank_line():
+    assert _front_matter("pretty_name: Bench", "") == "pretty_name: Bench"
+    assert _front_matter("pretty_name: Bench", "dataset_info:\n  a: 1") == "pretty_name: Bench\ndataset_info:\n  a: 1"
+
+
+@pytest.mark.parametrize("dataset_info", ["dataset_info:\n  a: [1", "dataset_info: {}\npretty_name: Other"])
+def test_front_matter_rejects_invalid_yaml(dataset_info):
+    with pytest.raises(yaml.YAMLError):
+        _front_matter("pretty_name: Bench", dataset_info)
+
+
+def test_upload_card_does_not_push_invalid_front_matter(card_config, remote_readme):
+    readme, _ = remote_readme
+    readme.write_text("---\ndataset_info: {}\npretty_name: x\n---\n", encoding="utf-8")
+    with patch.object(HfApi, "upload_file") as upload:
+        upload_dataset_card(card_config)
+    upload.assert_not_called()
+
+
+def test_serialize_config_masks_prefixes_of_any_length(monkeypatch):
+    monkeypatch.setattr(dataset_engine, "_SECRET_PLACEHOLDERS", {"sk-": "$OPENAI_API_KEY", "ghp_": "$GITHUB_TOKEN"})
+    monkeypatch.setattr(dataset_engine, "_SECRET_PREFIXES", ("sk-", "ghp_"))
+    serialized = yaml.safe_load(_serialize_config_for_card({"tokens": ["ghp_abc", "sk-abc"]}))
+    assert serialized == {"tokens": ["$GITHUB_TOKEN", "$OPENAI_API_KEY"]}
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+import pytest
+
+from yourbench.utils import dataset_engine
+from yourbench.utils.dataset_engine import get_hf_settings
+
+
+@pytest.fixture(autouse=True)
+def online(monkeypatch):
+    monkeypatch.delenv("HF_HUB_OFFLINE", raising=False)
+    dataset_engine._whoami_name.cache_clear()
+    dataset_engine._check_repo.cache_clear()
+
+
+def test_organization_lookup_is_cached():
+    config = {"hf_configuration": {"hf_dataset_name": "bench", "token": "hf_test"}}
+    with patch("yourbench.utils.dataset_engine.whoami", return_value={"name": "someone"}) as mock_whoami:
+        assert get_hf_settings(config).repo_id == "someone/bench"
+        assert get_hf_settings(config).repo_id == "someone/bench"
+    mock_whoami.assert_called_once()
+
+
+def test_repo_validation_is_cached():
+    settings = dataset_engine.HFSettings(dataset_name="bench", organization="org", token=None, local_dir=None)
+    with patch.object(dataset_engine._HF_API, "repo_info") as mock_repo_info:
+        dataset_engine._validate_repo(settings)
+        dataset_engine._validate_repo(settings)
+    mock_repo_info.assert_called_once()
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from datasets import Dataset
+from yourbench.utils.dataset_engine import get_hf_settings, custom_load_dataset, custom_save_dataset
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    return {
+        "hf_configuration": {"hf_dataset_name": "local_dataset", "local_saving": True},
+        "local_dataset_dir": str(tmp_path / "dataset"),
+    }
+
+
+def test_save_subsets_side_by_side(config):
+    custom_save_dataset(Dataset.from_dict({"a": [1, 2]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"b": ["x"]}), config, subset="second")
+
+    assert custom_load_dataset(config, subset="first")["a"] == [1, 2]
+    assert custom_load_dataset(config, subset="second")["b"] == ["x"]
+
+
+def test_save_concat_appends_rows(config):
+    config["hf_configuration"]["concat_if_exist"] = True
+    custom_save_dataset(Dataset.from_dict({"a": [1]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"a": [2]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"a": [3]}), config, subset="first")
+
+    assert custom_load_dataset(config, subset="first")["a"] == [1, 2, 3]
+
+
+def test_save_overwrite_drops_appended_rows(config):
+    config["hf_configuration"]["concat_if_exist"] = True
+    custom_save_dataset(Dataset.from_dict({"a": [1]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"a": [2]}), config, subset="first")
+
+    config["hf_configuration"]["concat_if_exist"] = False
+    loaded = custom_load_dataset(config, subset="first")
+    custom_save_dataset(loaded.map(lambda row: {"a": row["a"] * 10}), config, subset="first")
+
+    assert custom_load_dataset(config, subset="first")["a"] == [10, 20]
+
+
+def test_push_concatenates_prefetched_remote(config, monkeypatch):
+    monkeypatch.delenv("HF_HUB_OFFLINE")
+    monkeypatch.delenv("HF_TOKEN", raising=False)
+    config["hf_configuration"].update(concat_if_exist=True, local_saving=False, hf_organization="org")
+    pushed = []
+    with (
+        patch("yourbench.utils.dataset_engine._load_hub", return_value=Dataset.from_dict({"a": [1]})) as mock_load,
+        patch("yourbench.utils.dataset_engine._validate_repo"),
+        patch.object(Dataset, "push_to_hub", lambda self, **kwargs: pushed.append(list(self["a"]))),
+    ):
+        custom_save_dataset(Dataset.from_dict({"a": [2]}), config, subset="first")
+
+    mock_load.assert_called_once_with("org/local_dataset", "first", None)
+    assert pushed == [[1, 2]]
+
+
+def test_presolved_settings_skip_extraction(config):
+    settings = get_hf_settings(config)
+    with patch("yourbench.utils.dataset_engine._extract_settings", side_effect=AssertionError):
+        custom_save_dataset(Dataset.from_dict({"a": [1]}), config, subset="first", settings=settings)
+        assert custom_load_dataset(config, subset="first", settings=settings)["a"] == [1]
+
+
+def test_save_concat_with_incompatible_schema_overwrites(config):
+    config["hf_configuration"]["concat_if_exist"] = True
+    custom_save_dataset(Dataset.from_dict({"a": [1]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"a": [2]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"a": ["x"]}), config, subset="first")
+
+    assert custom_load_dataset(config, subset="first")["a"] == ["x"]
+    custom_save_dataset(Dataset.from_dict({"a": ["y"]}), config, subset="first")
+    assert custom_load_dataset(config, subset="first")["a"] == ["x", "y"]
+
+
+def test_subset_saves_after_plain_save_keep_every_subset(config):
+    custom_save_dataset(Dataset.from_dict({"a": [1]}), config)
+    custom_save_dataset(Dataset.from_dict({"b": [2]}), config, subset="first")
+    custom_save_dataset(Dataset.from_dict({"c": [3]}), config, subset="second")
+
+    assert custom_load_dataset(config, subset="default")["a"] == [1]
+    assert custom_load_dataset(config, subset="first")["b"] == [2]
+    assert custom_load_dataset(config, subset="second")["c"] == [3]
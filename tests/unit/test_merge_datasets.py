@@ -0,0 +1,25 @@
+from datasets import Dataset, DatasetDict
+from yourbench.utils.dataset_engine import _merge_datasets
+
+
+def test_merge_subset_promotes_missing_columns():
+    existing = DatasetDict({"questions": Dataset.from_dict({"question": ["q1"]})})
+    new = Dataset.from_dict({"question": ["q2"], "score": [0.5]})
+
+    merged = _merge_datasets(existing, new, "questions")
+
+    assert merged["questions"].to_dict() == {"question": ["q1", "q2"], "score": [None, 0.5]}
+
+
+def test_merge_subset_overwrites_on_incompatible_types():
+    existing = DatasetDict({"questions": Dataset.from_dict({"score": ["high"]})})
+    new = Dataset.from_dict({"score": [0.5]})
+
+    merged = _merge_datasets(existing, new, "questions")
+
+    assert merged["questions"].to_dict() == {"score": [0.5]}
+
+
+def test_merge_without_subset_concatenates():
+    merged = _merge_datasets(Dataset.from_dict({"a": [1]}), Dataset.from_dict({"a": [2]}), None)
+    assert merged["a"] == [1, 2]
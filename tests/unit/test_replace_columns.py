@@ -0,0 +1,24 @@
+from datasets import Dataset
+from yourbench.utils.dataset_engine import replace_dataset_columns
+
+
+def test_replace_existing_and_add_new_columns():
+    dataset = Dataset.from_dict({"question": ["q1", "q2"], "score": [0.0, 0.0]})
+    result = replace_dataset_columns(dataset, {"score": [0.5, 1.0], "extra": [1, 2]})
+
+    assert result.column_names == ["question", "score", "extra"]
+    assert result["score"] == [0.5, 1.0]
+    assert result["extra"] == [1, 2]
+
+
+def test_replace_columns_on_selected_rows():
+    dataset = Dataset.from_dict({"question": ["q1", "q2", "q3"], "score": [1.0, 2.0, 3.0]}).select([2, 0])
+    result = replace_dataset_columns(dataset, {"score": [30.0, 10.0]})
+
+    assert result["question"] == ["q3", "q1"]
+    assert result["score"] == [30.0, 10.0]
+
+
+def test_replace_no_columns_returns_dataset():
+    dataset = Dataset.from_dict({"question": ["q1"]})
+    assert replace_dataset_columns(dataset, {}) is dataset
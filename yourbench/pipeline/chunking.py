@@ -133,8 +133,10 @@ def run(config: dict[str, Any]) -> None:
 
     logger.info("Starting chunking stage...")
 
+    hf_settings = get_hf_settings(config)
+
     # Load dataset
-    dataset = custom_load_dataset(config=config, subset="summarized")
+    dataset = custom_load_dataset(config=config, subset="summarized", settings=hf_settings)
     logger.info(f"Loaded {len(dataset)} documents for chunking")
 
     # Extract configuration
@@ -174,14 +176,13 @@ def run(config: dict[str, Any]) -> None:
     )
 
     # Save dataset
-    hf_settings = get_hf_settings(config)
-
     custom_save_dataset(
         dataset=dataset,
         config=config,
         subset="chunked",
         save_local=hf_settings.local_saving,
         push_to_hub=True,
+        settings=hf_settings,
     )
 
     elapsed_total = time.time() - start_time
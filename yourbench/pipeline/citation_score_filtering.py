@@ -56,9 +56,11 @@ def run(config: dict[str, Any]) -> None:
         logger.info("citation_score_filtering stage is disabled. Skipping.")
         return
 
+    hf_settings = get_hf_settings(config)
+
     logger.info(f"Loading '{stage_cfg.subset}' subset for citation score filtering...")
     try:
-        lighteval_ds = custom_load_dataset(config=config, subset=stage_cfg.subset)
+        lighteval_ds = custom_load_dataset(config=config, subset=stage_cfg.subset, settings=hf_settings)
     except Exception as e:
         logger.exception(f"Could not load subset '{stage_cfg.subset}': {e}")
         return
@@ -96,12 +98,12 @@ def run(config: dict[str, Any]) -> None:
 
     # Save dataset
     logger.info("Saving updated dataset with new citation score columns...")
-    hf_settings = get_hf_settings(config)
     custom_save_dataset(
         dataset=lighteval_ds,
         config=config,
         subset=stage_cfg.subset,
         save_local=hf_settings.local_saving,
         push_to_hub=True,
+        settings=hf_settings,
     )
     logger.success("citation_score_filtering stage completed successfully.")
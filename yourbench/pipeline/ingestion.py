@@ -299,5 +299,6 @@ def _upload_to_hub(config: dict[str, Any], md_files: list[Path]):
         subset="ingested",
         save_local=hf_settings.local_saving,
         push_to_hub=True,
+        settings=hf_settings,
     )
     logger.info(f"Uploaded {len(docs)} documents to Hub")
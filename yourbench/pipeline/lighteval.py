@@ -95,30 +95,32 @@ def run(config: Dict[str, Any]) -> None:
     summarized_subset = stage_cfg.get("summarized_subset", "summarized")
     output_subset = stage_cfg.get("output_subset", "lighteval")
 
+    hf_settings = get_hf_settings(config)
+
     # Load datasets
     try:
-        single_shot_ds = custom_load_dataset(config=config, subset=single_shot_subset)
+        single_shot_ds = custom_load_dataset(config=config, subset=single_shot_subset, settings=hf_settings)
         logger.info(f"Loaded single-shot Q subset with {len(single_shot_ds)} rows.")
     except Exception as e:
         logger.warning(f"Could not load single-shot subset: {e}")
         single_shot_ds = Dataset.from_dict({})
 
     try:
-        multi_hop_ds = custom_load_dataset(config=config, subset=multi_hop_subset)
+        multi_hop_ds = custom_load_dataset(config=config, subset=multi_hop_subset, settings=hf_settings)
         logger.info(f"Loaded multi-hop Q subset with {len(multi_hop_ds)} rows.")
     except Exception as e:
         logger.warning(f"Could not load multi-hop subset: {e}")
         multi_hop_ds = Dataset.from_dict({})
 
     try:
-        cross_doc_ds = custom_load_dataset(config=config, subset=cross_doc_subset)
+        cross_doc_ds = custom_load_dataset(config=config, subset=cross_doc_subset, settings=hf_settings)
         logger.info(f"Loaded cross-document Q subset with {len(cross_doc_ds)} rows.")
     except Exception as e:
         logger.warning(f"Could not load cross-document subset: {e}")
         cross_doc_ds = Dataset.from_dict({})  # empty fallback
 
     try:
-        chunked_ds = custom_load_dataset(config=config, subset=chunked_subset)
+        chunked_ds = custom_load_dataset(config=config, subset=chunked_subset, settings=hf_settings)
         logger.info(f"Loaded chunked subset with {len(chunked_ds)} rows.")
     except Exception as e:
         logger.error(f"Could not load chunked subset: {e}")
@@ -126,7 +128,7 @@ def run(config: Dict[str, Any]) -> None:
         chunked_ds = Dataset.from_dict({})  # empty fallback
 
     try:
-        summarized_ds = custom_load_dataset(config=config, subset=summarized_subset)
+        summarized_ds = custom_load_dataset(config=config, subset=summarized_subset, settings=hf_settings)
         logger.info(f"Loaded summarized subset with {len(summarized_ds)} rows.")
     except Exception as e:
         logger.error(f"Could not load summarized subset: {e}")
@@ -297,12 +299,12 @@ def run(config: Dict[str, Any]) -> None:
         return
 
     # Save dataset
-    hf_settings = get_hf_settings(config)
     custom_save_dataset(
         dataset=final_ds,
         config=config,
         subset=output_subset,
         save_local=hf_settings.local_saving,
         push_to_hub=True,
+        settings=hf_settings,
     )
     logger.success("Lighteval dataset saved successfully.")
@@ -81,7 +81,8 @@ def run_single_shot(config: dict[str, Any]) -> None:
 
     system_msg = {"role": "system", "content": system_prompt}
 
-    dataset = custom_load_dataset(config=config, subset="chunked")
+    hf_settings = get_hf_settings(config)
+    dataset = custom_load_dataset(config=config, subset="chunked", settings=hf_settings)
     logger.info(f"Loaded {len(dataset)} chunks for single-shot.")
 
     sampling_cfg = get_sampling_cfg(stage_cfg)
@@ -101,13 +102,13 @@ def run_single_shot(config: dict[str, Any]) -> None:
 
     if final_rows:
         logger.info(f"Saving {len(final_rows)} single-shot questions.")
-        hf_settings = get_hf_settings(config)
         custom_save_dataset(
             Dataset.from_list(final_rows),
             config=config,
             subset="single_shot_questions",
             save_local=hf_settings.local_saving,
             push_to_hub=True,
+            settings=hf_settings,
         )
 
 
@@ -137,7 +138,8 @@ def run_multi_hop(config: dict[str, Any]) -> None:
     )
     system_msg = {"role": "system", "content": system_prompt}
 
-    chunked_ds = custom_load_dataset(config=config, subset="chunked")
+    hf_settings = get_hf_settings(config)
+    chunked_ds = custom_load_dataset(config=config, subset="chunked", settings=hf_settings)
     logger.info(f"Loaded {len(chunked_ds)} documents for multi-hop processing.")
 
     def _run_and_save(dataset, label: str):
@@ -156,13 +158,13 @@ def run_multi_hop(config: dict[str, Any]) -> None:
 
         if final_rows:
             logger.info(f"Saving {len(final_rows)} {label} questions.")
-            hf_settings = get_hf_settings(config)
             custom_save_dataset(
                 Dataset.from_list(final_rows),
                 config=config,
                 subset=label,
                 save_local=hf_settings.local_saving,
                 push_to_hub=True,
+                settings=hf_settings,
             )
         else:
             logger.info(f"No valid {label} questions parsed.")
@@ -18,7 +18,7 @@ from loguru import logger
 
 from datasets import Dataset
 from yourbench.utils.prompts import QUESTION_REWRITING_SYSTEM_PROMPT, QUESTION_question_rewriting_USER_PROMPT
-from yourbench.utils.dataset_engine import get_hf_settings, custom_load_dataset, custom_save_dataset
+from yourbench.utils.dataset_engine import HFSettings, get_hf_settings, custom_load_dataset, custom_save_dataset
 from yourbench.utils.parsing_engine import extract_content_from_xml_tags
 from yourbench.utils.question_models import QuestionRow
 from yourbench.utils.inference.inference_core import InferenceCall, run_inference
@@ -174,6 +174,7 @@ def _process_question_type(
     load_subset: str,
     save_subset: str,
     additional_instructions: str,
+    hf_settings: HFSettings,
 ) -> None:
     """
     Loads, rewrites, and saves a specific type of questions.
@@ -184,10 +185,11 @@ def _process_question_type(
         load_subset: The dataset subset to load questions from.
         save_subset: The dataset subset to save rewritten questions to.
         additional_instructions: Instructions for the rewriting model.
+        hf_settings: HF settings resolved once for the stage.
     """
     try:
         logger.info(f"Processing {question_type} questions...")
-        dataset = custom_load_dataset(config=config, subset=load_subset)
+        dataset = custom_load_dataset(config=config, subset=load_subset, settings=hf_settings)
 
         if not dataset or len(dataset) == 0:
             logger.warning(f"No {question_type} questions found or dataset is empty.")
@@ -209,13 +211,13 @@ def _process_question_type(
             return
 
         rewritten_ds = Dataset.from_list(rewritten_rows)
-        hf_settings = get_hf_settings(config)
         custom_save_dataset(
             dataset=rewritten_ds,
             config=config,
             subset=save_subset,
             save_local=hf_settings.local_saving,
             push_to_hub=True,
+            settings=hf_settings,
         )
         logger.success(f"Saved {len(rewritten_rows)} rewritten {question_type} questions.")
 
@@ -250,6 +252,7 @@ def run(config: Dict[str, Any]) -> None:
         "multi-hop": ("multi_hop_questions", "multi_hop_questions_rewritten"),
     }
 
+    hf_settings = get_hf_settings(config)
     for question_type, (load_subset, save_subset) in question_types_to_process.items():
         _process_question_type(
             config=config,
@@ -257,6 +260,7 @@ def run(config: Dict[str, Any]) -> None:
             load_subset=load_subset,
             save_subset=save_subset,
             additional_instructions=additional_instructions,
+            hf_settings=hf_settings,
         )
 
     logger.success("Question question_rewriting stage completed")
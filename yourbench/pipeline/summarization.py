@@ -152,7 +152,8 @@ def run(config: dict[str, Any]) -> None:
 
     logger.info("=== Summarization v2 – map-reduce ===")
 
-    dataset = custom_load_dataset(config=config, subset="ingested")
+    hf_settings = get_hf_settings(config)
+    dataset = custom_load_dataset(config=config, subset="ingested", settings=hf_settings)
     if not dataset or len(dataset) == 0:
         logger.warning("Ingested dataset is empty or None – nothing to summarise.")
         return
@@ -199,12 +200,12 @@ def run(config: dict[str, Any]) -> None:
     dataset = dataset.add_column("summarization_model", [effective_model_name] * len(dataset))
 
     # Save dataset
-    hf_settings = get_hf_settings(config)
     custom_save_dataset(
         dataset=dataset,
         config=config,
         subset="summarized",
         save_local=hf_settings.local_saving,
         push_to_hub=True,
+        settings=hf_settings,
     )
     logger.success(f"Hierarchical summarization completed ({len(dataset)} documents).")
@@ -1,19 +1,51 @@
+import io
 import os
+import re
+import json
 import math
 import random
 import shutil
+import asyncio
+import hashlib
 import tempfile
+from uuid import uuid4
 from typing import Any, Set, List, TypeVar, Sequence
 from pathlib import Path
+from functools import lru_cache
 from contextlib import suppress
 from dataclasses import dataclass
-
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as _package_version
+
+import yaml
+import numpy as np
+import jinja2
+import pyarrow as pa
+import pyarrow.compute as pc
 from loguru import logger
 
-from datasets import Dataset, DatasetDict, load_dataset, load_from_disk, concatenate_datasets
-from huggingface_hub import HfApi, DatasetCard, DatasetCardData, whoami
+from datasets import (
+    Value,
+    Dataset,
+    Features,
+    DatasetDict,
+    DatasetInfo,
+    load_dataset,
+    load_from_disk,
+    concatenate_datasets,
+)
+from huggingface_hub import HfApi, DatasetCardData, whoami
+from datasets.fingerprint import get_temporary_cache_files_directory
+from datasets.arrow_writer import ArrowWriter
 from huggingface_hub.utils import HFValidationError
+from datasets.features.features import _check_if_features_can_be_aligned
+
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; unranking then runs on the NumPy path
+    njit = prange = None
 
 __all__ = [
     "custom_load_dataset",
@@ -25,6 +57,33 @@ __all__ = [
 
 T = TypeVar("T")
 
+# Shared Hub client; every call goes through huggingface_hub's process-wide HTTP session
+_HF_API = HfApi()
+
+# Background workers for Hub downloads that overlap with local work
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yourbench-prefetch")
+
+# Schema of the rows produced by create_cross_document_dataset
+_CROSS_DOCUMENT_FEATURES = Features({
+    "document_id": Value("string"),
+    "document_summary": Value("string"),
+    "chunks": [{"chunk_id": Value("string"), "chunk_text": Value("string")}],
+    "multihop_chunks": [{"chunk_ids": [Value("string")], "chunks_text": [Value("string")]}],
+    # Traceability metadata, stored as plain columns
+    "source_documents": [Value("string")],
+    "num_source_docs": Value("int64"),
+    "chunks_per_doc": Value("int64"),
+    "total_chunks_sampled": Value("int64"),
+    "source_indices": [Value("int64")],
+    "generation_method": Value("string"),
+})
+
+# Number of cross-document rows buffered in memory before being written out
+_CROSS_DOCUMENT_BATCH_SIZE = 2048
+
+# Prefix of shard directories written next to a saved dataset when concat_if_exist is set
+_APPEND_PREFIX = "_append_"
+
 
 class ConfigurationError(Exception):
     """Configuration error."""
@@ -66,7 +125,11 @@ def _expand_var(value: str, field: str) -> str:
 
 
 def get_hf_settings(config: dict[str, Any]) -> HFSettings:
-    """Public getter for HF settings used in other modules."""
+    """Public getter for HF settings used in other modules.
+
+    Resolve once per stage and pass the result to custom_load_dataset /
+    custom_save_dataset via `settings=` to skip re-parsing the configuration.
+    """
     return _extract_settings(config)
 
 
@@ -99,6 +162,18 @@ def _extract_settings(config: dict[str, Any]) -> HFSettings:
     )
 
 
+@lru_cache(maxsize=32)
+def _whoami_name(token: str) -> str | None:
+    """Return the account name for token. Cached so the Hub is queried once per process."""
+    return whoami(token=token).get("name")
+
+
+@lru_cache(maxsize=128)
+def _check_repo(repo_id: str, token: str | None) -> None:
+    """Query the dataset repository info. Cached on success so validation hits the Hub once."""
+    _HF_API.repo_info(repo_id=repo_id, repo_type="dataset", token=token)
+
+
 def _resolve_organization(org: str | None, token: str | None) -> str | None:
     """Resolve organization, fetching from HF if needed."""
     if _is_offline() or (org and not org.startswith("$")):
@@ -112,7 +187,7 @@ def _resolve_organization(org: str | None, token: str | None) -> str | None:
         return None
 
     try:
-        if username := whoami(token=token).get("name"):
+        if username := _whoami_name(token):
             logger.info(f"Using '{username}' as organization")
             return username
     except HFValidationError:
@@ -131,7 +206,7 @@ def _validate_repo(settings: HFSettings) -> None:
         return
 
     try:
-        HfApi().repo_info(repo_id=settings.repo_id, repo_type="dataset", token=settings.token)
+        _check_repo(settings.repo_id, settings.token)
     except HFValidationError as e:
         raise ConfigurationError(f"Invalid repo ID '{settings.repo_id}': {e}") from e
     except (ConnectionError, TimeoutError) as e:
@@ -145,7 +220,7 @@ def _validate_repo(settings: HFSettings) -> None:
 def _load_local(path: Path, subset: str | None) -> Dataset:
     """Load dataset from local path with detailed inspection logs."""
     logger.info(f"Loading '{subset or 'default'}' from {path}")
-    dataset = load_from_disk(str(path))
+    dataset = _read_disk(path)
 
     logger.debug(f"Loaded type: {type(dataset)}")
 
@@ -160,6 +235,39 @@ def _load_local(path: Path, subset: str | None) -> Dataset:
     raise ConfigurationError(f"Subset '{subset}' not found in local dataset")
 
 
+def _append_shards(path: Path) -> list[Path]:
+    """Return the shard directories appended to the dataset saved at path, in write order."""
+    return sorted(p for p in path.glob(f"{_APPEND_PREFIX}*") if p.is_dir())
+
+
+def _with_appended(dataset: Dataset, path: Path) -> Dataset:
+    """Concatenate the shards appended at path onto the dataset loaded from it."""
+    shards = _append_shards(path)
+    if not shards:
+        return dataset
+    logger.debug(f"Concatenating {len(shards)} appended shard(s) from {path}")
+    return concatenate_datasets([dataset, *(load_from_disk(str(p)) for p in shards)])
+
+
+def _can_append(dataset: Dataset, path: Path) -> bool:
+    """Whether dataset's features align with the dataset and shards stored at path."""
+    stored = [DatasetInfo.from_directory(str(p)).features for p in (path, *_append_shards(path))]
+    try:
+        _check_if_features_can_be_aligned([*stored, dataset.features])
+    except ValueError as e:
+        logger.warning(f"Could not append to {path} (schema mismatch). Overwriting. Error: {e}")
+        return False
+    return True
+
+
+def _read_disk(path: Path) -> Dataset | DatasetDict:
+    """Load a dataset or dataset dict from disk, including appended shards."""
+    dataset = load_from_disk(str(path))
+    if isinstance(dataset, DatasetDict):
+        return DatasetDict({name: _with_appended(split, path / name) for name, split in dataset.items()})
+    return _with_appended(dataset, path)
+
+
 def _load_hub(repo_id: str, subset: str | None, token: str | None) -> Dataset:
     """Load dataset from HuggingFace Hub."""
     logger.info(f"Loading '{subset or 'default'}' from Hub: {repo_id}")
@@ -178,7 +286,14 @@ def _load_hub(repo_id: str, subset: str | None, token: str | None) -> Dataset:
 
 
 def _merge_datasets(existing: Dataset | DatasetDict, new: Dataset, subset: str | None) -> Dataset | DatasetDict:
-    """Merge new dataset with existing. If subset exists, new data is concatenated."""
+    """Merge new dataset with existing. If subset exists, new data is concatenated.
+
+    concatenate_datasets concatenates the underlying Arrow tables with
+    promote_options="default": chunks are referenced, not copied (memory-mapped
+    blocks stay memory-mapped, so _safe_save can still detect self-overwrites),
+    and columns missing on one side are null-filled. Only truly incompatible
+    column types raise, which is when a subset is overwritten instead.
+    """
     if subset is None:
         if isinstance(existing, Dataset):
             return concatenate_datasets([existing, new])
@@ -216,9 +331,56 @@ def _safe_save(dataset: Dataset | DatasetDict, path: Path) -> None:
         logger.success(f"Saved to {path} (via temp)")
 
 
-def custom_load_dataset(config: dict[str, Any], subset: str | None = None) -> Dataset:
-    """Load dataset subset from local path or Hub. Raises errors if data missing or invalid."""
-    settings = _extract_settings(config)
+def _register_subset(root: Path, subset: str) -> None:
+    """Add subset to the split list of the dataset dict stored at root."""
+    dict_path = root / "dataset_dict.json"
+    splits = json.loads(dict_path.read_text())["splits"] if dict_path.exists() else []
+    if subset not in splits:
+        dict_path.write_text(json.dumps({"splits": [*splits, subset]}))
+
+
+def _save_local(dataset: Dataset, root: Path, subset: str | None, concat: bool) -> None:
+    """
+    Save dataset under root without rewriting data that is already on disk.
+
+    Each subset lives in its own directory of a dataset dict layout, so saving one
+    subset leaves the others untouched. With concat, new rows are written as an
+    extra shard directory that is concatenated back when loading; like _merge_datasets,
+    a schema that can't be aligned with the stored one overwrites the subset instead.
+    """
+    if subset and (root / "state.json").exists():
+        # A subset-less dataset occupies the root, so the whole tree has to be rewritten:
+        # saving the dict in place would leave the root's own files shadowing it
+        merged = _merge_datasets(_read_disk(root), dataset, subset)
+        with tempfile.TemporaryDirectory() as tmp:
+            merged.save_to_disk(tmp)
+            shutil.rmtree(root)
+            shutil.copytree(tmp, root)
+        logger.success(f"Saved to {root} (via temp)")
+        return
+
+    target = root / subset if subset else root
+    if concat and (target / "state.json").exists() and _can_append(dataset, target):
+        shard = target / f"{_APPEND_PREFIX}{len(_append_shards(target)):05d}_{uuid4().hex}"
+        dataset.save_to_disk(str(shard))
+        logger.success(f"Appended {len(dataset)} rows to {target}")
+    else:
+        _safe_save(dataset, target)
+        for shard in _append_shards(target):
+            shutil.rmtree(shard, ignore_errors=True)
+
+    if subset:
+        _register_subset(root, subset)
+
+
+def custom_load_dataset(
+    config: dict[str, Any], subset: str | None = None, *, settings: HFSettings | None = None
+) -> Dataset:
+    """Load dataset subset from local path or Hub. Raises errors if data missing or invalid.
+
+    Pass `settings` from get_hf_settings() to reuse settings resolved once per stage.
+    """
+    settings = settings or _extract_settings(config)
 
     if settings.local_dir and settings.local_dir.exists():
         return _load_local(settings.local_dir, subset)
@@ -237,42 +399,31 @@ def custom_save_dataset(
     *,
     save_local: bool = True,
     push_to_hub: bool = True,
+    settings: HFSettings | None = None,
 ) -> None:
-    """Save dataset locally and/or push to Hub."""
-    settings = _extract_settings(config)
+    """Save dataset locally and/or push to Hub.
+
+    Pass `settings` from get_hf_settings() to reuse settings resolved once per stage.
+    """
+    settings = settings or _extract_settings(config)
 
     if _is_offline():
         save_local = True
         push_to_hub = False
         logger.info("Offline mode - only saving locally")
 
+    # Start downloading the remote dataset now so it overlaps with the local save
+    remote_future = None
+    if push_to_hub and settings.concat_if_exist:
+        remote_future = _PREFETCH_EXECUTOR.submit(_load_hub, settings.repo_id, subset, settings.token)
+
     # Check both local_saving flag and local_dir existence
     if save_local and settings.local_saving and settings.local_dir:
         logger.info(f"Saving to {settings.local_dir}")
 
-        existing = None
-        if settings.local_dir.exists():
-            logger.info(f"Loading existing dataset at: {settings.local_dir}")
-            try:
-                existing = load_from_disk(str(settings.local_dir))
-            except (FileNotFoundError, PermissionError, OSError) as e:
-                logger.warning(f"Error loading existing dataset from disk: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error loading existing dataset: {e}")
-                raise
-
-        if settings.concat_if_exist and existing:
-            new = concatenate_datasets([existing, dataset])
-        elif existing and subset:
-            # only add subset to existing dataframe
-            existing[subset] = dataset
-            new = existing
-        else:
-            new = DatasetDict({subset: dataset}) if subset else dataset
-
         # Ensure the local directory exists before saving
         settings.local_dir.mkdir(parents=True, exist_ok=True)
-        _safe_save(new, settings.local_dir)
+        _save_local(dataset, settings.local_dir, subset, settings.concat_if_exist)
     elif save_local and settings.local_saving and not settings.local_dir:
         logger.warning("Local saving enabled but no local_dataset_dir specified in configuration")
     elif save_local and not settings.local_saving:
@@ -280,20 +431,23 @@ def custom_save_dataset(
 
     # TODO also update this part on how concat and merge is done
     if push_to_hub and not _is_offline():
-        if settings.concat_if_exist:
+        if remote_future is not None:
             with suppress(Exception):
-                existing = _load_hub(settings.repo_id, subset, settings.token)
+                existing = remote_future.result()
                 dataset = concatenate_datasets([existing, dataset])
                 logger.info("Concatenated with existing remote")
 
         _validate_repo(settings)
         logger.info(f"Pushing to Hub: {settings.repo_id}")
+        # CDC (content-defined chunking) of the pushed Parquet shards applies when datasets>=4.1
         dataset.push_to_hub(
             repo_id=settings.repo_id,
             private=settings.private,
             config_name=subset or "default",
             token=settings.token,
         )
+        # push_to_hub rewrites the README's dataset_info section
+        _remote_readme.cache_clear()
         logger.success(f"Pushed to Hub: {settings.repo_id}")
 
 
@@ -307,13 +461,32 @@ def replace_dataset_columns(
         logger.info(f"Removing columns: {to_remove}")
         dataset = dataset.remove_columns(to_remove)
 
-    for name, data in columns_data.items():
-        dataset = dataset.add_column(name, data)
+    if not columns_data:
+        return dataset
+
+    # Build all new columns as one table and attach them in a single column-wise concat,
+    # instead of rebuilding the dataset's table once per add_column call
+    new_columns = Dataset.from_dict(columns_data)
+    return concatenate_datasets([dataset, new_columns], axis=1)
 
-    return dataset
 
+def _pascal_table(n: int, k: int) -> np.ndarray:
+    """
+    Return the table of binomial coefficients C(m, i) for 0 ≤ m ≤ n and 0 ≤ i ≤ k.
+
+    The table is built with Pascal's rule in O(n·k) additions so that unranking
+    can replace repeated `math.comb` calls with O(1) lookups. Entries are stored
+    as int64 when the largest coefficient fits, and as Python ints otherwise.
+    """
+    fits_int64 = math.comb(n, min(k, n // 2)) <= np.iinfo(np.int64).max
+    table = np.zeros((n + 1, k + 1), dtype=np.int64 if fits_int64 else object)
+    table[:, 0] = 1
+    for m in range(1, n + 1):
+        table[m, 1:] = table[m - 1, 1:] + table[m - 1, :-1]
+    return table
 
-def _unrank_comb(n: int, k: int, rank: int) -> List[int]:
+
+def _unrank_comb(n: int, k: int, rank: int, table: np.ndarray | None = None) -> List[int]:
     """
     Return the k-combination of [0, n) corresponding to the given rank
     in colexicographic (colex) order.
@@ -331,6 +504,9 @@ def _unrank_comb(n: int, k: int, rank: int) -> List[int]:
     rank : int
         Integer in the range [0, C(n, k)) specifying the position of the combination
         in colexicographic order.
+    table : np.ndarray, optional
+        Precomputed binomial coefficients from `_pascal_table(n', k')` with n' ≥ n
+        and k' ≥ k. When given, it replaces the `math.comb` calls.
 
     Returns
     -------
@@ -345,27 +521,79 @@ def _unrank_comb(n: int, k: int, rank: int) -> List[int]:
     """
     if not 0 <= k <= n:
         raise ValueError(f"require 0 ≤ k ≤ n, got k={k}, n={n}")
-    max_rank = math.comb(n, k)
+    binom = math.comb if table is None else lambda m, i: int(table[m, i])
+    max_rank = binom(n, k)
     if not 0 <= rank < max_rank:
         raise ValueError(f"rank must be in [0,{max_rank - 1}], got {rank}")
 
     combo: List[int] = []
     for i in range(k, 0, -1):
-        # largest c such that C(c, i) ≤ rank (binary search)
+        # largest c such that C(c, i) ≤ rank (binary search); `n` shrinks to the previous digit
         lo, hi = i - 1, n - 1
         while lo < hi:
             mid = (lo + hi + 1) // 2
-            if math.comb(mid, i) <= rank:
+            if binom(mid, i) <= rank:
                 lo = mid
             else:
                 hi = mid - 1
         combo.append(lo)
-        rank -= math.comb(lo, i)
+        rank -= binom(lo, i)
         n = lo  # next digit must be < current one
     combo.reverse()
     return combo
 
 
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _unrank_comb_kernel(table, n, k, ranks, combos):
+        """Compiled colex unrank of every rank in `ranks` into the rows of `combos`."""
+        for r in prange(ranks.shape[0]):
+            rank = ranks[r]
+            upper = n
+            for i in range(k, 0, -1):
+                if rank == 0:
+                    # the remaining digits are the smallest possible ones: 0, ..., i-1
+                    for j in range(i):
+                        combos[r, j] = j
+                    break
+                lo, hi = i - 1, upper - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) >> 1
+                    if table[mid, i] <= rank:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                combos[r, i - 1] = lo
+                rank -= table[lo, i]
+                upper = lo
+
+
+def _unrank_comb_batch(table: np.ndarray, n: int, k: int, ranks: Sequence[int]) -> np.ndarray:
+    """
+    Vectorized `_unrank_comb`: convert every rank to its colex k-combination of [0, n).
+
+    With numba installed and an int64 table, the per-rank binary searches run in a
+    compiled, parallel kernel. Otherwise each of the k digits is peeled off for all
+    ranks at once with `np.searchsorted` over a column of the Pascal table. Ranks
+    are assumed to be valid, i.e. in [0, C(n, k)).
+
+    Returns an array of shape (len(ranks), k) whose rows are strictly increasing.
+    """
+    combos = np.empty((len(ranks), k), dtype=np.int64)
+    remaining = np.asarray(ranks, dtype=table.dtype)
+    if njit is not None and table.dtype == np.int64:
+        _unrank_comb_kernel(table, n, k, remaining, combos)
+        return combos
+
+    for i in range(k, 0, -1):
+        # largest c < n such that C(c, i) ≤ rank; the colex remainder keeps later digits below it
+        digits = np.searchsorted(table[:n, i], remaining, side="right") - 1
+        combos[:, i - 1] = digits
+        remaining = remaining - table[digits, i]
+    return combos
+
+
 def _floyd_sample_indices(total: int, sample_size: int, *, rng: random.Random | None = None) -> Set[int]:
     """Select sample_size unique integers ∈ [0, total) uniformly at random"""
     if sample_size > total:
@@ -376,35 +604,54 @@ def _floyd_sample_indices(total: int, sample_size: int, *, rng: random.Random |
     chosen: Set[int] = set()
     for j in range(total - sample_size, total):
         t = rng.randrange(0, j + 1)
-        chosen.add(t if t not in chosen else j)
+        size = len(chosen)
+        chosen.add(t)
+        if len(chosen) == size:  # t was already taken; j never is, since chosen ⊆ [0, j)
+            chosen.add(j)
     return chosen
 
 
 def _sample_exact_combinations(
-    objects: Sequence[T], k: int, N: int, *, rng: random.Random | None = None
+    objects: Sequence[T],
+    k: int,
+    N: int,
+    *,
+    rng: random.Random | None = None,
+    np_rng: np.random.Generator | None = None,
+    table: np.ndarray | None = None,
 ) -> List[List[T]]:
     """Draw N distinct k-combinations from objects exactly uniformly.
 
-    The function first uses Bob Floyd to pick N distinct ranks in
-    `[0, C(n,k))` (where `n = len(objects)`), then converts each rank to its
-    combination via `_unrank_comb`, and finally maps the integer indices back
-    to the actual objects.
+    The function first picks N distinct ranks in `[0, C(n,k))` (where
+    `n = len(objects)`), then converts each rank to its combination via
+    `_unrank_comb_batch`, and finally maps the integer indices back to the
+    actual objects.
+
+    When `np_rng` is given and the rank space fits in int64, the ranks are drawn
+    with `np_rng.choice(..., replace=False)`, which samples in C (switching to a
+    set-based Floyd draw itself when N is small relative to the rank space).
+    Otherwise Bob Floyd's algorithm is run with `rng`.
+
+    `table` may pass a Pascal table from `_pascal_table(n, k')` with k' ≥ k to
+    share it across calls; one is built otherwise.
     """
     n = len(objects)
     if not 0 <= k <= n:
         raise ValueError("require 0 ≤ k ≤ n")
-    total = math.comb(n, k)
+    if table is None:
+        table = _pascal_table(n, k)
+    total = int(table[n, k])
     if N > total:
         raise ValueError("cannot request more combinations than exist")
     if rng is None:
         rng = random
 
-    ranks = _floyd_sample_indices(total, N, rng=rng)
-    combos: List[List[T]] = []
-    for r in ranks:
-        idxs = _unrank_comb(n, k, r)
-        combos.append([objects[i] for i in idxs])
-    return combos
+    if np_rng is not None and total <= np.iinfo(np.int64).max:
+        ranks = np_rng.choice(total, size=N, replace=False)
+    else:
+        ranks = list(_floyd_sample_indices(total, N, rng=rng))
+    idx_rows = _unrank_comb_batch(table, n, k, ranks)
+    return [[objects[i] for i in idxs] for idxs in idx_rows.tolist()]
 
 
 def create_cross_document_dataset(dataset: Dataset, stage_cfg: dict[str, Any]) -> Dataset:
@@ -449,30 +696,66 @@ def create_cross_document_dataset(dataset: Dataset, stage_cfg: dict[str, Any]) -
         logger.warning("Dataset is missing 'multihop_chunks'. Cross-document generation aborted.")
         return Dataset.from_list([])
 
-    # Extract documents with valid multihop_chunks
+    # Extract documents with valid multihop_chunks, reading only the needed columns
+    # and dropping rows with empty chunk lists in Arrow before any Python conversion
+    needed_columns = [c for c in ("document_id", "document_summary", "multihop_chunks") if c in dataset.column_names]
+    table = dataset.select_columns(needed_columns).with_format("arrow")[:]
+    multihop_type = table.schema.field("multihop_chunks").type
+
     docs = []
-    for idx, row in enumerate(dataset):
-        multihop_chunks = row.get("multihop_chunks", [])
-        if isinstance(multihop_chunks, list) and multihop_chunks:
-            valid_chunks = [
-                chunk
-                for chunk in multihop_chunks
-                if isinstance(chunk, dict) and all(key in chunk for key in ("chunk_ids", "chunks_text"))
-            ]
-            if valid_chunks:
+    if pa.types.is_list(multihop_type) or pa.types.is_large_list(multihop_type):
+        non_empty = pc.fill_null(pc.greater(pc.list_value_length(table["multihop_chunks"]), 0), False)
+        original_indices = pc.indices_nonzero(non_empty).to_pylist()
+        table = table.filter(non_empty)
+
+        # A list<struct<chunk_ids, chunks_text, ...>> column without null entries already
+        # guarantees every chunk is a dict with both keys, so the per-chunk check can be skipped
+        value_type = multihop_type.value_type
+        chunks_are_valid = (
+            pa.types.is_struct(value_type)
+            and {"chunk_ids", "chunks_text"} <= {field.name for field in value_type}
+            and pc.list_flatten(table["multihop_chunks"]).null_count == 0
+        )
+
+        position = 0
+        for batch in table.to_batches(max_chunksize=2048):
+            # Convert column by column; only the selected columns of surviving rows reach Python
+            batch_columns = batch.to_pydict()
+            doc_ids = batch_columns.get("document_id")
+            summaries = batch_columns.get("document_summary")
+
+            for j, multihop_chunks in enumerate(batch_columns["multihop_chunks"]):
+                idx = original_indices[position + j]
+
+                if chunks_are_valid:
+                    valid_chunks = multihop_chunks
+                else:
+                    valid_chunks = [
+                        chunk
+                        for chunk in multihop_chunks
+                        if isinstance(chunk, dict) and all(key in chunk for key in ("chunk_ids", "chunks_text"))
+                    ]
+                if not valid_chunks:
+                    continue
+
                 # Create more readable and collision-resistant document IDs
-                doc_id = row.get("document_id", f"doc_{idx}")
+                doc_id = doc_ids[j] if doc_ids is not None else f"doc_{idx}"
                 # Clean doc_id for safe ID generation
                 clean_doc_id = "".join(c for c in str(doc_id) if c.isalnum() or c in "_-")
                 if not clean_doc_id:
                     clean_doc_id = f"doc_{idx}"
 
+                # Object array so sampled chunk indices can be gathered in one step
+                chunk_array = np.empty(len(valid_chunks), dtype=object)
+                chunk_array[:] = valid_chunks
+
                 docs.append({
                     "document_id": clean_doc_id,
                     "original_index": idx,
-                    "document_summary": row.get("document_summary", ""),
-                    "multihop_chunks": valid_chunks,
+                    "document_summary": summaries[j] if summaries is not None else "",
+                    "multihop_chunks": chunk_array,
                 })
+            position += batch.num_rows
 
     if len(docs) < min_docs:
         logger.warning(f"Found only {len(docs)} document(s) with valid 'multihop_chunks'. Need at least {min_docs}.")
@@ -480,156 +763,235 @@ def create_cross_document_dataset(dataset: Dataset, stage_cfg: dict[str, Any]) -
 
     logger.info(f"Found {len(docs)} documents with valid multihop_chunks")
 
-    # Initialize random number generator
+    # Initialize random number generators; NumPy draws the combination ranks and chunk indices
     rng = random.Random(random_seed)
+    np_rng = np.random.default_rng(random_seed)
 
     # Generate combinations efficiently using exact uniform sampling
-    cross_rows = []
+    # Output rows are buffered column by column and streamed to an Arrow file in
+    # batches, so memory stays bounded regardless of max_combinations
+    schema = _CROSS_DOCUMENT_FEATURES.arrow_schema
+    columns: dict[str, list] = {name: [] for name in _CROSS_DOCUMENT_FEATURES}
+    num_rows = 0
 
     # Strategy: distribute combinations across different group sizes
-    # Calculate total possible combinations across all group sizes
-    total_possible_combinations = sum(
-        math.comb(len(docs), k) for k in range(min_docs, min(max_docs + 1, len(docs) + 1))
-    )
+    # Calculate possible combinations per group size once, from a Pascal table that
+    # is also shared with the combination sampler
+    group_sizes = range(min_docs, min(max_docs + 1, len(docs) + 1))
+    pascal_table = _pascal_table(len(docs), group_sizes[-1])
+    combinations_per_size = {k: int(pascal_table[len(docs), k]) for k in group_sizes}
+    total_possible_combinations = sum(combinations_per_size.values())
 
     logger.info(f"Total possible combinations: {total_possible_combinations}")
 
     # Cap max_combinations to what's actually possible
     actual_max_combinations = min(max_combinations, total_possible_combinations)
 
-    # For each possible number of documents to combine
-    for num_docs_to_combine in range(min_docs, min(max_docs + 1, len(docs) + 1)):
-        # Calculate how many combinations we can make with this number of docs
-        combinations_for_this_size = math.comb(len(docs), num_docs_to_combine)
+    # Cross-document rows live in the process-wide temporary cache directory that `datasets`
+    # removes on exit, so the returned Dataset can memory-map them for the rest of the run
+    arrow_path = os.path.join(get_temporary_cache_files_directory(), f"cross_document-{uuid4().hex}.arrow")
+    with ArrowWriter(features=_CROSS_DOCUMENT_FEATURES, path=arrow_path) as writer:
+
+        def flush() -> None:
+            """Write the buffered rows as one Arrow record batch and reset the buffer."""
+            nonlocal num_rows
+            if columns["document_id"]:
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                num_rows += len(columns["document_id"])
+                for values in columns.values():
+                    values.clear()
+
+        # For each possible number of documents to combine
+        for num_docs_to_combine in group_sizes:
+            # How many combinations we can make with this number of docs
+            combinations_for_this_size = combinations_per_size[num_docs_to_combine]
+
+            if combinations_for_this_size == 0:
+                continue
 
-        if combinations_for_this_size == 0:
-            continue
+            # Determine how many combinations to generate for this group size
+            remaining_combinations = actual_max_combinations - num_rows - len(columns["document_id"])
+            if remaining_combinations <= 0:
+                break
 
-        # Determine how many combinations to generate for this group size
-        remaining_combinations = actual_max_combinations - len(cross_rows)
-        if remaining_combinations <= 0:
-            break
+            # Simple proportional allocation
+            proportion = combinations_for_this_size / total_possible_combinations
+            target_for_this_size = max(1, int(proportion * actual_max_combinations))
+            actual_for_this_size = min(target_for_this_size, combinations_for_this_size, remaining_combinations)
 
-        # Simple proportional allocation
-        proportion = combinations_for_this_size / total_possible_combinations
-        target_for_this_size = max(1, int(proportion * actual_max_combinations))
-        actual_for_this_size = min(target_for_this_size, combinations_for_this_size, remaining_combinations)
+            if actual_for_this_size <= 0:
+                continue
 
-        if actual_for_this_size <= 0:
-            continue
+            logger.info(f"Generating {actual_for_this_size} combinations with {num_docs_to_combine} documents")
 
-        logger.info(f"Generating {actual_for_this_size} combinations with {num_docs_to_combine} documents")
+            # Use exact uniform sampling to get distinct combinations
+            try:
+                doc_combinations = _sample_exact_combinations(
+                    docs, num_docs_to_combine, actual_for_this_size, rng=rng, np_rng=np_rng, table=pascal_table
+                )
+            except ValueError as e:
+                logger.warning(f"Could not generate combinations for {num_docs_to_combine} docs: {e}")
+                continue
 
-        # Use exact uniform sampling to get distinct combinations
-        try:
-            doc_combinations = _sample_exact_combinations(docs, num_docs_to_combine, actual_for_this_size, rng=rng)
-        except ValueError as e:
-            logger.warning(f"Could not generate combinations for {num_docs_to_combine} docs: {e}")
-            continue
+            # Process each combination
+            for doc_group in doc_combinations:
+                sampled_chunks_from_group = []
+                doc_ids_for_tracing = []
+
+                # Sample chunks from each document in the group
+                for doc in doc_group:
+                    doc_ids_for_tracing.append(doc["document_id"])
+
+                    doc_chunks = doc["multihop_chunks"]
+                    if len(doc_chunks) == 0:
+                        continue
+
+                    # Sample the specified number of chunks from this document as index draws
+                    num_chunks_to_sample = min(chunks_per_document, len(doc_chunks))
+                    if num_chunks_to_sample == 1:
+                        chunk_idxs = np_rng.integers(0, len(doc_chunks), size=1)
+                    else:
+                        chunk_idxs = np_rng.choice(len(doc_chunks), num_chunks_to_sample, replace=False)
+
+                    sampled_chunks_from_group.extend(doc_chunks[chunk_idxs].tolist())
+
+                # Validation: ensure we have chunks from the expected number of documents
+                # (This addresses the original validation mismatch issue)
+                expected_total_chunks = len(doc_group) * chunks_per_document
+                if len(sampled_chunks_from_group) < len(doc_group):
+                    logger.warning(f"Insufficient chunks sampled from document group {doc_ids_for_tracing}")
+                    continue
 
-        # Process each combination
-        for doc_group in doc_combinations:
-            sampled_chunks_from_group = []
-            doc_ids_for_tracing = []
+                # Combine chunks from all documents in the group
+                combined_ids = []
+                combined_texts = []
+
+                for chunk in sampled_chunks_from_group:
+                    chunk_ids = chunk.get("chunk_ids", [])
+                    chunk_texts = chunk.get("chunks_text", [])
+
+                    if isinstance(chunk_ids, list):
+                        combined_ids.extend(chunk_ids)
+                    else:
+                        combined_ids.append(chunk_ids)
+
+                    if isinstance(chunk_texts, list):
+                        combined_texts.extend(chunk_texts)
+                    else:
+                        combined_texts.append(chunk_texts)
+
+                # Create combined multihop chunk
+                combined_multihop_chunk = {
+                    "chunk_ids": combined_ids,
+                    "chunks_text": combined_texts,
+                }
+
+                # Combine document summaries
+                doc_summaries = [
+                    doc["document_summary"]
+                    for doc in doc_group
+                    if doc.get("document_summary") and doc["document_summary"].strip()
+                ]
+
+                combined_summary = ""
+                if doc_summaries:
+                    header = "Here are the summaries from the various documents involved in the chunking:"
+                    summary_bullets = "\n".join(f"- {s}" for s in doc_summaries)
+                    combined_summary = f"{header}\n\n{summary_bullets}"
+
+                # Create readable and collision-resistant ID
+                doc_ids_sorted = sorted(doc_ids_for_tracing)
+                doc_ids_str = "_".join(doc_ids_sorted)
+
+                # Create a human-readable, deterministic ID using number of documents, sorted document IDs, and chunks per document
+                cross_doc_id = f"cross_{len(doc_group)}docs_{doc_ids_str}_chunks{chunks_per_document}"
+
+                columns["document_id"].append(cross_doc_id)
+                columns["document_summary"].append(combined_summary)
+                columns["chunks"].append([])  # keep consistent with original schema
+                columns["multihop_chunks"].append([combined_multihop_chunk])
+
+                # Add comprehensive metadata for traceability
+                columns["source_documents"].append(doc_ids_sorted)
+                columns["num_source_docs"].append(len(doc_group))
+                columns["chunks_per_doc"].append(chunks_per_document)
+                columns["total_chunks_sampled"].append(len(sampled_chunks_from_group))
+                columns["source_indices"].append(sorted([doc["original_index"] for doc in doc_group]))
+                columns["generation_method"].append("exact_uniform_sampling")
+
+                if len(columns["document_id"]) >= _CROSS_DOCUMENT_BATCH_SIZE:
+                    flush()
+
+        flush()
+        writer.finalize()
+
+    if not num_rows:
+        logger.warning("No cross-document combinations were generated.")
+        os.remove(arrow_path)
+        return Dataset.from_list([])
 
-            # Sample chunks from each document in the group
-            for doc in doc_group:
-                doc_ids_for_tracing.append(doc["document_id"])
+    if num_rows < max_combinations:
+        logger.info(f"Generated {num_rows} out of {max_combinations} requested combinations.")
+    else:
+        logger.info(f"Successfully generated {num_rows} cross-document combinations.")
 
-                if not doc["multihop_chunks"]:
-                    continue
+    return Dataset.from_file(arrow_path)
 
-                # Sample the specified number of chunks from this document
-                num_chunks_to_sample = min(chunks_per_document, len(doc["multihop_chunks"]))
-                if num_chunks_to_sample == 1:
-                    sampled_chunks = [rng.choice(doc["multihop_chunks"])]
-                else:
-                    sampled_chunks = rng.sample(doc["multihop_chunks"], num_chunks_to_sample)
 
-                sampled_chunks_from_group.extend(sampled_chunks)
+# Dataset card generation functions
 
-            # Validation: ensure we have chunks from the expected number of documents
-            # (This addresses the original validation mismatch issue)
-            expected_total_chunks = len(doc_group) * chunks_per_document
-            if len(sampled_chunks_from_group) < len(doc_group):
-                logger.warning(f"Insufficient chunks sampled from document group {doc_ids_for_tracing}")
-                continue
+try:
+    _YOURBENCH_VERSION = _package_version("yourbench")
+except PackageNotFoundError:
+    # Fallback for development installs
+    _YOURBENCH_VERSION = "dev"
 
-            # Combine chunks from all documents in the group
-            combined_ids = []
-            combined_texts = []
+# Separators turned into spaces when deriving a pretty_name from the dataset name
+_PRETTY_NAME_TABLE = str.maketrans("-_", "  ")
 
-            for chunk in sampled_chunks_from_group:
-                chunk_ids = chunk.get("chunk_ids", [])
-                chunk_texts = chunk.get("chunks_text", [])
+_DEFAULT_TEMPLATE_PATH = str(Path(__file__).with_name("yourbench_card_template.md"))
 
-                if isinstance(chunk_ids, list):
-                    combined_ids.extend(chunk_ids)
-                else:
-                    combined_ids.append(chunk_ids)
 
-                if isinstance(chunk_texts, list):
-                    combined_texts.extend(chunk_texts)
-                else:
-                    combined_texts.append(chunk_texts)
-
-            # Create combined multihop chunk
-            combined_multihop_chunk = {
-                "chunk_ids": combined_ids,
-                "chunks_text": combined_texts,
-            }
-
-            # Combine document summaries
-            doc_summaries = [
-                doc["document_summary"]
-                for doc in doc_group
-                if doc.get("document_summary") and doc["document_summary"].strip()
-            ]
-
-            combined_summary = ""
-            if doc_summaries:
-                header = "Here are the summaries from the various documents involved in the chunking:"
-                summary_bullets = "\n".join(f"- {s}" for s in doc_summaries)
-                combined_summary = f"{header}\n\n{summary_bullets}"
-
-            # Create readable and collision-resistant ID
-            doc_ids_sorted = sorted(doc_ids_for_tracing)
-            doc_ids_str = "_".join(doc_ids_sorted)
-
-            # Create a human-readable, deterministic ID using number of documents, sorted document IDs, and chunks per document
-            cross_doc_id = f"cross_{len(doc_group)}docs_{doc_ids_str}_chunks{chunks_per_document}"
-
-            # Add comprehensive metadata for traceability
-            metadata = {
-                "source_documents": doc_ids_sorted,
-                "num_source_docs": len(doc_group),
-                "chunks_per_doc": chunks_per_document,
-                "total_chunks_sampled": len(sampled_chunks_from_group),
-                "source_indices": sorted([doc["original_index"] for doc in doc_group]),
-                "generation_method": "exact_uniform_sampling",
-            }
-
-            cross_rows.append({
-                "document_id": cross_doc_id,
-                "document_summary": combined_summary,
-                "chunks": [],  # keep consistent with original schema
-                "multihop_chunks": [combined_multihop_chunk],
-                "cross_document_metadata": metadata,  # add traceability
-            })
-
-    if not cross_rows:
-        logger.warning("No cross-document combinations were generated.")
-        return Dataset.from_list([])
+@lru_cache(maxsize=8)
+def _load_template(path: str) -> str:
+    """Read a card template once per path."""
+    return Path(path).read_text(encoding="utf-8")
 
-    if len(cross_rows) < max_combinations:
-        logger.info(f"Generated {len(cross_rows)} out of {max_combinations} requested combinations.")
-    else:
-        logger.info(f"Successfully generated {len(cross_rows)} cross-document combinations.")
 
-    return Dataset.from_list(cross_rows)
+# Default settings, matching what DatasetCard.from_template renders with
+_JINJA_ENV = jinja2.Environment()
+_JINJA_ENV.globals["yourbench_version"] = _YOURBENCH_VERSION
 
 
-# Dataset card generation functions
+@lru_cache(maxsize=8)
+def _compiled_template(template_str: str) -> jinja2.Template:
+    """Compile a card template once per template string."""
+    return _JINJA_ENV.from_string(template_str)
+
+
+@lru_cache(maxsize=1)
+def _default_template() -> jinja2.Template:
+    """The bundled card template, read and compiled on first use."""
+    return _compiled_template(_load_template(_DEFAULT_TEMPLATE_PATH))
+
+
+def _readme_metadata(readme: str) -> str:
+    """Return the YAML front matter of a README, or an empty string if it has none."""
+    # Extract the content between the '---' markers
+    metadata_match = re.findall(r"---\n(.*?)\n---", readme, re.DOTALL)
+    if not metadata_match:
+        logger.debug("No YAML metadata found in the README.md")
+        return ""
+    return metadata_match[0]
+
+
+def _dataset_info_section(readme_metadata: str) -> str:
+    """Return the metadata from its `dataset_info:` key onwards, or an empty string."""
+    section_prefix = "dataset_info:"
+    if section_prefix not in readme_metadata:
+        return ""
+    # Extract the part after `dataset_info:` prefix
+    return section_prefix + readme_metadata.split(section_prefix)[1]
 
 
 def extract_readme_metadata(repo_id: str, token: str | None = None) -> str:
@@ -642,21 +1004,8 @@ def extract_readme_metadata(repo_id: str, token: str | None = None) -> str:
         The metadata extracted from the README.md file of the dataset repository as a str.
     """
     try:
-        import re
-        from pathlib import Path
-
-        from huggingface_hub.file_download import hf_hub_download
-
-        readme_path = Path(hf_hub_download(repo_id, "README.md", repo_type="dataset", token=token))
-        # Extract the content between the '---' markers
-        metadata_match = re.findall(r"---\n(.*?)\n---", readme_path.read_text(), re.DOTALL)
-
-        if not metadata_match:
-            logger.debug("No YAML metadata found in the README.md")
-            return ""
-
-        return metadata_match[0]
-
+        readme_path = Path(_HF_API.hf_hub_download(repo_id, "README.md", repo_type="dataset", token=token))
+        return _readme_metadata(readme_path.read_text())
     except Exception as e:
         logger.debug(f"Failed to extract metadata from README.md: {e}")
         return ""
@@ -673,59 +1022,112 @@ def extract_dataset_info(repo_id: str, token: str | None = None) -> str:
     Returns:
         The dataset_info section as a string, or empty string if not found
     """
-    readme_metadata = extract_readme_metadata(repo_id=repo_id, token=token)
-    if not readme_metadata:
-        return ""
+    return _dataset_info_section(extract_readme_metadata(repo_id=repo_id, token=token))
 
-    section_prefix = "dataset_info:"
-    if section_prefix not in readme_metadata:
-        return ""
 
+@lru_cache(maxsize=16)
+def _remote_readme(repo_id: str, token: str | None) -> tuple[str, str | None]:
+    """Download the repo's README.md once and return its dataset_info section and blake2b digest.
+
+    Cached until the README changes; ("", None) when it can't be fetched.
+    """
     try:
-        # Extract the part after `dataset_info:` prefix
-        config_data = section_prefix + readme_metadata.split(section_prefix)[1]
-        return config_data
-    except IndexError:
-        logger.debug("Failed to extract dataset_info section from metadata")
-        return ""
+        readme = Path(_HF_API.hf_hub_download(repo_id, "README.md", repo_type="dataset", token=token)).read_bytes()
+    except Exception as e:
+        logger.debug(f"Could not fetch README.md for {repo_id}: {e}")
+        return "", None
+    return _dataset_info_section(_readme_metadata(readme.decode("utf-8"))), hashlib.blake2b(readme).hexdigest()
+
+
+class _UniqueKeyLoader(yaml.SafeLoader):
+    """SafeLoader that rejects duplicate mapping keys instead of keeping the last one."""
+
+    def construct_mapping(self, node, deep=False):
+        seen = set()
+        for key_node, _ in node.value:
+            key = self.construct_object(key_node, deep=deep)
+            if key in seen:
+                raise yaml.constructor.ConstructorError(None, None, f"duplicate key {key!r}", key_node.start_mark)
+            seen.add(key)
+        return super().construct_mapping(node, deep=deep)
+
+
+def _front_matter(card_yaml: str, config_data: str) -> str:
+    """Join the card metadata and the preserved dataset_info into the README front matter.
+
+    The result is parsed before it is uploaded, since config_data is carried over verbatim
+    from the remote README and may be malformed.
+    """
+    front_matter = "\n".join(filter(None, [card_yaml, config_data]))
+    if not isinstance(yaml.load(front_matter, Loader=_UniqueKeyLoader), dict):
+        raise ValueError("Dataset card front matter is not a YAML mapping")
+    return front_matter
+
+
+# Placeholders substituted for secret-looking string values in the serialized config
+_SECRET_PLACEHOLDERS = {"sk-": "$OPENAI_API_KEY", "hf_": "$HF_TOKEN"}
+_SECRET_PREFIXES = tuple(_SECRET_PLACEHOLDERS)
+
+# libyaml-backed dumper when PyYAML was built with it; same output as SafeDumper
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _sanitize_str(value: str, key: str | None) -> str:
+    """Mask a secret-looking string or api_key value with its placeholder."""
+    # Keep placeholders
+    if value.startswith("$"):
+        return value
+    # Mask only api_key arguments
+    if key and "api_key" in key.lower():
+        return "$API_KEY"
+    # Mask OpenAI API keys and HuggingFace tokens
+    if value.startswith(_SECRET_PREFIXES):
+        return next(v for p, v in _SECRET_PLACEHOLDERS.items() if value.startswith(p))
+    return value
+
+
+def _sanitize_dict(value: dict, key: str | None) -> dict:
+    """Sanitize each value, passing its key along for api_key masking."""
+    return {k: _sanitize(v, k) for k, v in value.items()}
+
+
+def _sanitize_list(value: list, key: str | None) -> list:
+    """Sanitize each item of a list."""
+    return [_sanitize(v) for v in value]
+
+
+def _keep(value: Any, key: str | None) -> Any:
+    """Return a value that cannot hold secrets unchanged."""
+    return value
+
+
+_SANITIZERS = {
+    dict: _sanitize_dict,
+    list: _sanitize_list,
+    str: _sanitize_str,
+    bool: _keep,
+    int: _keep,
+    float: _keep,
+    type(None): _keep,
+}
+
+
+def _sanitize(obj: Any, key: str | None = None) -> Any:
+    """Return a copy of a config tree with secrets masked, dispatching on the exact type."""
+    handler = _SANITIZERS.get(type(obj))
+    if handler is None:
+        # Subclasses (e.g. OrderedDict) fall back to an isinstance match
+        handler = next((h for t, h in _SANITIZERS.items() if isinstance(obj, t)), _keep)
+    return handler(obj, key)
 
 
 def _serialize_config_for_card(config: dict[str, Any]) -> str:
     """
     Sanitize and serialize pipeline config to YAML for inclusion in dataset card.
     """
-    try:
-        import yaml
-    except ImportError:
-        raise ImportError("PyYAML is required for config serialization")
-    from copy import deepcopy
-
-    def _sanitize(obj, key=None):
-        if isinstance(obj, dict):
-            return {k: _sanitize(v, k) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [_sanitize(v) for v in obj]
-        if isinstance(obj, str):
-            # Keep placeholders
-            if obj.startswith("$"):
-                return obj
-            # Mask only api_key arguments
-            if key and "api_key" in key.lower():
-                return "$API_KEY"
-            # Mask OpenAI API keys
-            if obj.startswith("sk-"):
-                return "$OPENAI_API_KEY"
-            # Mask HuggingFace tokens
-            if obj.startswith("hf_"):
-                return "$HF_TOKEN"
-            return obj
-        # Explicitly return boolean, integer, float, and None values unchanged
-        if obj is None or isinstance(obj, (bool, int, float)):
-            return obj
-        return obj
-
-    sanitized = _sanitize(deepcopy(config))
-    return yaml.safe_dump(sanitized, sort_keys=False, default_flow_style=False)
+    # _sanitize builds a new tree, so the config itself is never modified
+    sanitized = _sanitize(config)
+    return yaml.dump(sanitized, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False)
 
 
 def _get_pipeline_subset_info(config: dict[str, Any]) -> str:
@@ -762,12 +1164,17 @@ def _get_pipeline_subset_info(config: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _generate_and_upload_dataset_card(config: dict[str, Any], template_path: str | None = None) -> None:
+async def _generate_and_upload_dataset_card(
+    config: dict[str, Any], hf_config: dict[str, Any], template_path: str | None = None
+) -> None:
     """
     Internal implementation that generates and uploads a dataset card to Hugging Face Hub.
 
     This is the core implementation function called by the public upload_dataset_card() function.
-    It handles the actual card generation and uploading without performing configuration checks.
+    It handles the actual card generation and uploading without performing configuration checks;
+    the upload_card flag and offline mode are checked once by the caller.
+    The README fetch for the existing dataset_info and the config serialization run in worker
+    threads while the card data is prepared, and the upload itself is also run off the event loop. Upload failures are logged here; anything else is raised to the caller.
 
     The dataset card includes:
     1. Pipeline subset descriptions based on enabled stages
@@ -777,95 +1184,94 @@ def _generate_and_upload_dataset_card(config: dict[str, Any], template_path: str
 
     Args:
         config: Configuration dictionary containing HF settings
+        hf_config: The config's 'hf_configuration' section, as already read by the caller
         template_path: Optional custom template path
     """
-    logger.info("Starting dataset card upload process")
-
-    if _is_offline():
-        logger.warning("Offline mode enabled. Skipping dataset card upload.")
+    # Get dataset repo name
+    settings = _extract_settings(config)
+    dataset_repo_name = settings.repo_id
+    logger.info(f"Uploading card for dataset: {dataset_repo_name}")
+
+    # Load template
+    if not template_path:
+        template = _default_template()
+    elif os.path.exists(template_path):
+        template = _compiled_template(_load_template(template_path))
+    else:
+        logger.error(f"Template file not found: {template_path}")
         return
 
-    try:
-        # Get dataset repo name
-        settings = _extract_settings(config)
-        dataset_repo_name = settings.repo_id
-        logger.info(f"Uploading card for dataset: {dataset_repo_name}")
-
-        # Load template
-        if not template_path:
-            # Try to find template in utils directory
-            current_dir = os.path.dirname(__file__)
-            template_path = os.path.join(current_dir, "yourbench_card_template.md")
-
-        logger.info(f"Loading template from: {template_path}")
-
-        if not os.path.exists(template_path):
-            logger.error(f"Template file not found: {template_path}")
-            return
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_str = f.read()
-
-        logger.debug(f"Template loaded successfully, length: {len(template_str)} characters")
+    # Get HF token
+    token = settings.token
 
-        # Get HF token
-        token = settings.token
-
-        # Extract dataset_info section from existing README if available
-        config_data = extract_dataset_info(repo_id=dataset_repo_name, token=token)
-        logger.info(f"Extracted dataset_info section, length: {len(config_data) if config_data else 0} characters")
-
-        # Use explicitly configured pretty_name or generate one from the dataset name
-        hf_config = config.get("hf_configuration", {})
-        if "pretty_name" in hf_config:
-            pretty_name = hf_config["pretty_name"]
-        else:
-            dataset_name = dataset_repo_name.split("/")[-1]
-            pretty_name = dataset_name.replace("-", " ").replace("_", " ").title()
-
-        card_data_kwargs = {"pretty_name": pretty_name}
-
-        # Create DatasetCardData with our metadata
-        card_data = DatasetCardData(**card_data_kwargs)
-        logger.info(f"Created card data with pretty_name: {card_data.pretty_name}")
-
-        # Get YourBench version
-        from importlib.metadata import PackageNotFoundError, version
+    # Download the existing README once, if available, for its dataset_info section and digest, and
+    # serialize the config sections in worker threads while the card data is prepared
+    sections = asyncio.gather(
+        asyncio.to_thread(_remote_readme, dataset_repo_name, token),
+        asyncio.to_thread(_serialize_config_for_card, config),
+        asyncio.to_thread(_get_pipeline_subset_info, config),
+    )
 
-        try:
-            version_str = version("yourbench")
-        except PackageNotFoundError:
-            # Fallback for development installs
-            version_str = "dev"
+    # Use explicitly configured pretty_name or generate one from the dataset name
+    if "pretty_name" in hf_config:
+        pretty_name = hf_config["pretty_name"]
+    else:
+        pretty_name = dataset_repo_name.rsplit("/", 1)[-1].translate(_PRETTY_NAME_TABLE).title()
 
-        # Prepare template variables
-        template_vars = {
-            "pretty_name": card_data.pretty_name,
-            "yourbench_version": version_str,
-            "config_yaml": _serialize_config_for_card(config),
-            "pipeline_subsets": _get_pipeline_subset_info(config),
-            "config_data": config_data,  # Use the extracted dataset_info section
-            "footer": hf_config.get("footer", "*(This dataset card was automatically generated by YourBench)*"),
-        }
+    card_data_kwargs = {"pretty_name": pretty_name}
 
-        logger.info("Rendering dataset card from template")
-        logger.debug(f"Template variables: {list(template_vars.keys())}")
+    # Create DatasetCardData with our metadata
+    card_data = DatasetCardData(**card_data_kwargs)
 
-        # Render card with our template and variables
-        card = DatasetCard.from_template(card_data=card_data, template_str=template_str, **template_vars)
+    (config_data, remote_digest), config_yaml, pipeline_subsets = await sections
 
-        logger.info("Template rendered successfully")
-        logger.debug(f"Rendered card content length: {len(str(card))} characters")
+    # Prepare template variables
+    template_vars = {
+        "pretty_name": card_data.pretty_name,
+        "config_yaml": config_yaml,
+        "pipeline_subsets": pipeline_subsets,
+        "config_data": config_data,  # Use the extracted dataset_info section
+        "footer": hf_config.get("footer", "*(This dataset card was automatically generated by YourBench)*"),
+    }
 
-        # Push to hub
-        logger.info(f"Pushing dataset card to hub: {dataset_repo_name}")
-        card.push_to_hub(dataset_repo_name, token=token)
+    # Render card with our template and variables, exposing card_data the same way from_template does
+    card_yaml = card_data.to_yaml()
+    context = {
+        **card_data.to_dict(),
+        **template_vars,
+        "card_data": card_yaml,
+        "front_matter": _front_matter(card_yaml, config_data),
+    }
+    readme = io.BytesIO()
+    template.stream(context).dump(readme, encoding="utf-8")
+    logger.debug(
+        f"Rendered card from {template_path or _DEFAULT_TEMPLATE_PATH}: {readme.tell()} bytes, "
+        f"dataset_info section {len(config_data)} characters"
+    )
 
-        logger.success(f"Dataset card successfully uploaded to: https://huggingface.co/datasets/{dataset_repo_name}")
+    if hashlib.blake2b(readme.getvalue()).hexdigest() == remote_digest:
+        logger.info(f"Dataset card for {dataset_repo_name} is unchanged, skipping upload")
+        return
 
+    # Push to hub; only the network call is guarded, template and config errors propagate to the caller
+    readme.seek(0)
+    try:
+        await asyncio.to_thread(
+            _HF_API.upload_file,
+            path_or_fileobj=readme,
+            path_in_repo="README.md",
+            repo_id=dataset_repo_name,
+            repo_type="dataset",
+            token=token,
+            commit_message="Update dataset card",
+        )
     except Exception as e:
-        logger.error(f"Failed to upload dataset card: {e}")
-        logger.exception("Full traceback:")
+        logger.exception(f"Failed to upload dataset card: {e}")
+        return
+    # The README we just fetched is now outdated
+    _remote_readme.cache_clear()
+
+    logger.success(f"Dataset card successfully uploaded to: https://huggingface.co/datasets/{dataset_repo_name}")
 
 
 def upload_dataset_card(config: dict[str, Any]) -> None:
@@ -880,21 +1286,19 @@ def upload_dataset_card(config: dict[str, Any]) -> None:
         config: Pipeline configuration dictionary containing 'hf_configuration'
                with settings like 'upload_card' flag
     """
-    try:
-        # Check if card upload is enabled in config
-        hf_config = config.get("hf_configuration", {})
-        upload_card = hf_config.get("upload_card", True)
-
-        if not upload_card:
-            logger.info("Dataset card upload disabled in configuration. Skipping card upload.")
-            return
+    # Check if card upload is enabled in config, before doing any other work
+    hf_config = config.get("hf_configuration") or {}
+    if not hf_config.get("upload_card", True):
+        logger.info("Dataset card upload disabled in configuration. Skipping card upload.")
+        return
 
-        if _is_offline():
-            logger.info("Offline mode enabled. Skipping dataset card upload.")
-            return
+    if _is_offline():
+        logger.info("Offline mode enabled. Skipping dataset card upload.")
+        return
 
+    try:
         logger.info("Uploading dataset card with complete pipeline information")
-        _generate_and_upload_dataset_card(config)
+        asyncio.run(_generate_and_upload_dataset_card(config, hf_config))
 
     except Exception as e:
-        logger.error(f"Error uploading dataset card: {e}")
+        logger.exception(f"Error uploading dataset card: {e}")